@@ -1,13 +1,37 @@
+import math
+import os
 import sys
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import pygame
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python functions
+    def njit(*args, **kwargs):
+        def wrap(fn):
+            return fn
+        return wrap
+
 
 # Window configuration
 WIDTH, HEIGHT = 800, 600
 FPS = 60
+STEP_MS = 1000.0 / FPS  # fixed physics timestep
+_STEP_PX = 1.0  # STEP_MS expressed in frame-tick movement units
+MAX_FRAME_MS = 250  # cap on simulated time after a stall
+
+# Hoisted pygame lookups used on the per-frame path
+_K_W = pygame.K_w
+_K_S = pygame.K_s
+_K_ESCAPE = pygame.K_ESCAPE
+_K_R = pygame.K_r
+_QUIT = pygame.QUIT
+_KEYDOWN = pygame.KEYDOWN
+# Events after which the window contents must be fully repainted
+_REDRAW_EVENTS = (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE, pygame.WINDOWRESTORED)
+_draw_rect = pygame.draw.rect
 
 # Colors
 WHITE = (255, 255, 255)
@@ -24,83 +48,137 @@ BALL_SIZE = 14
 BALL_SPEED_START = 5.0
 BALL_SPEED_INCREMENT = 0.25
 BALL_SPEED_MAX = 12.0
+_BOUNCE_MAX_RAD = math.radians(60)  # max deflection off a paddle
 
 SCORE_TO_WIN = 11
 COUNTDOWN_TIME = 1200  # ms between point and serve
 
 
+@njit(
+    "Tuple((f8, f8, f8, f8, i8))(f8, f8, f8, f8, f8, f8, f8, f8)",
+    cache=True,
+    fastmath=True,
+)
+def _ball_step(x, y, vx, vy, dt, size, w, h):
+    # Advance the ball's top-left corner one step and resolve wall bounces.
+    # Returns the new (x, y, vx, vy, scored) with scored: -1 none, 0 left, 1 right
+    x += vx * dt
+    y += vy * dt
+
+    # Top/bottom collision
+    if y <= 0:
+        y = 0.0
+        vy = -vy
+    elif y + size >= h:
+        y = h - size
+        vy = -vy
+
+    scored = -1
+    if x + size < 0:
+        scored = 1  # right scores
+    elif x > w:
+        scored = 0  # left scores
+    return x, y, vx, vy, scored
+
+
+@njit("f8(f8, f8, f8, f8, f8, f8, f8)", cache=True, fastmath=True)
+def _predict_target_jit(ball_cx, ball_cy, vx, vy, paddle_left, h, jitter):
+    # Where the ball will be when it reaches paddle_left, with wall bounces.
+    # Expects vx > 0; the caller handles the ball-moving-away case
+    time_to_reach = (paddle_left - ball_cx) / vx
+    if time_to_reach <= 0:
+        return ball_cy
+
+    # Predict y with vertical bounces
+    predicted_y = ball_cy + vy * time_to_reach
+    # Mirror reflection within [0, h]: fold onto a triangle wave of period 2h
+    y = predicted_y % (2 * h)
+    predicted_y = y if y <= h else 2 * h - y
+    return predicted_y + jitter
+
+
 @dataclass
 class Bounds:
     width: int
     height: int
 
+    _center: pygame.Vector2 = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Bounds never change once the window exists, so build the center once
+        self._center = pygame.Vector2(self.width / 2, self.height / 2)
+
     @property
     def center(self) -> pygame.Vector2:
-        return pygame.Vector2(self.width / 2, self.height / 2)
+        return self._center
 
 
 class Paddle:
-    def __init__(self, x: int, y: int, width: int, height: int, speed: float) -> None:
+    def __init__(self, x: int, y: int, width: int, height: int, speed: float, image: pygame.Surface) -> None:
         self.rect = pygame.Rect(x, y, width, height)
+        self._y_f = float(y)  # sub-pixel position; rect.y is derived from it
+        self._prev_y_f = self._y_f  # position before the last physics step
         self.speed = speed
         self.velocity = 0.0
+        self.image = image  # pre-rendered shape, blitted each frame
 
     def update(self, dt: float, bounds: Bounds) -> None:
+        # Nothing moves on idle frames, and the paddle is already within bounds
+        if self.velocity == 0.0:
+            return
         # Move paddle vertically; clamp to screen bounds
-        dy = self.velocity * dt
-        self.rect.y += int(dy)
-        if self.rect.top < 0:
-            self.rect.top = 0
-        if self.rect.bottom > bounds.height:
-            self.rect.bottom = bounds.height
-
-    def draw(self, surf: pygame.Surface) -> None:
-        pygame.draw.rect(surf, WHITE, self.rect, border_radius=4)
+        y = self._y_f + self.velocity * dt
+        if y < 0:
+            y = 0.0
+        elif y + self.rect.height > bounds.height:
+            y = float(bounds.height - self.rect.height)
+        self._y_f = y
+        self.rect.y = int(y)
+
+    def save_position(self) -> None:
+        self._prev_y_f = self._y_f
+
+    def draw(self, surf: pygame.Surface, alpha: float = 1.0) -> pygame.Rect:
+        # Draw between the last two physics positions; returns the drawn rect
+        y = self._prev_y_f + (self._y_f - self._prev_y_f) * alpha
+        dest = self.rect.move(0, int(y) - self.rect.y)
+        surf.blit(self.image, dest)
+        return dest
 
     def center_y(self) -> float:
         return self.rect.centery
 
 
 class AIPaddle(Paddle):
-    def __init__(self, x: int, y: int, width: int, height: int, speed: float) -> None:
-        super().__init__(x, y, width, height, speed)
+    def __init__(
+        self, x: int, y: int, width: int, height: int, speed: float, bounds_height: int, image: pygame.Surface
+    ) -> None:
+        super().__init__(x, y, width, height, speed, image)
         # AI parameters tuned to be challenging but beatable
         self.reaction_delay = 0.10  # seconds before adjusting target
         self.error_margin = 18      # pixels of target jitter
         self.track_smooth = 0.18    # lerp factor toward target per update
         self._time_since_react = 0.0
         self._target_y = float(self.rect.centery)
+        self._center_y = bounds_height * 0.5  # resting target while the ball moves away
 
-    def _predict_target(self, ball_rect: pygame.Rect, ball_vel: pygame.Vector2, bounds: Bounds) -> float:
+    def _predict_target(self, ball_rect: pygame.Rect, vx: float, vy: float, bounds: Bounds) -> float:
         # Basic prediction: where ball will be when it reaches AI x, with wall bounces
-        if ball_vel.x <= 0:
+        if vx <= 0:
             # Ball moving away; drift back to center slowly
-            return bounds.height / 2
-
-        time_to_reach = (self.rect.left - ball_rect.centerx) / ball_vel.x
-        if time_to_reach <= 0:
-            return ball_rect.centery
-
-        # Predict y with vertical bounces
-        predicted_y = ball_rect.centery + ball_vel.y * time_to_reach
-        # Reflect off top/bottom bounds
-        h = bounds.height
-        # Mirror reflection within [0, h]
-        while predicted_y < 0 or predicted_y > h:
-            if predicted_y < 0:
-                predicted_y = -predicted_y
-            if predicted_y > h:
-                predicted_y = 2 * h - predicted_y
+            return self._center_y
 
         # Add a small error so AI is not perfect
         jitter = random.uniform(-self.error_margin, self.error_margin)
-        return predicted_y + jitter
+        return _predict_target_jit(
+            ball_rect.centerx, ball_rect.centery, vx, vy, self.rect.left, bounds.height, jitter
+        )
 
-    def update_ai(self, dt: float, ball_rect: pygame.Rect, ball_vel: pygame.Vector2, bounds: Bounds) -> None:
+    def update_ai(self, dt: float, ball_rect: pygame.Rect, ball_vx: float, ball_vy: float, bounds: Bounds) -> None:
         self._time_since_react += dt
         if self._time_since_react >= self.reaction_delay:
             self._time_since_react = 0.0
-            self._target_y = self._predict_target(ball_rect, ball_vel, bounds)
+            self._target_y = self._predict_target(ball_rect, ball_vx, ball_vy, bounds)
 
         # Smooth tracking towards target
         desired = self._target_y - self.rect.centery
@@ -113,73 +191,95 @@ class AIPaddle(Paddle):
 
 
 class Ball:
-    def __init__(self, x: int, y: int, size: int, speed: float) -> None:
+    def __init__(self, x: int, y: int, size: int, speed: float, image: pygame.Surface) -> None:
         self.rect = pygame.Rect(0, 0, size, size)
         self.rect.center = (x, y)
-        self.velocity = pygame.Vector2(speed, 0)
+        # Sub-pixel position; rect.x/rect.y are derived from it
+        self._x_f = float(self.rect.x)
+        self._y_f = float(self.rect.y)
+        # Position before the last physics step, for render interpolation
+        self._prev_x_f = self._x_f
+        self._prev_y_f = self._y_f
+        # Velocity kept as plain floats to avoid per-frame Vector2 allocations
+        self.vx = speed
+        self.vy = 0.0
         self.speed = speed
-        self.serve_cooldown = 0  # ms until movement resumes
+        self.serve_cooldown = 0.0  # ms until movement resumes
+        self.image = image  # pre-rendered shape, blitted each frame
 
     def reset(self, center: pygame.Vector2, to_left: bool | None = None) -> None:
         self.rect.center = (int(center.x), int(center.y))
+        self._x_f = float(self.rect.x)
+        self._y_f = float(self.rect.y)
+        # Teleport: don't interpolate across the court
+        self._prev_x_f = self._x_f
+        self._prev_y_f = self._y_f
         # Randomize initial direction
         angle_choices = [random.uniform(-25, 25), random.uniform(155, 205)]
         angle = random.choice(angle_choices)
-        direction = pygame.Vector2(1, 0).rotate(angle)
+        # Rotating the x-axis by angle gives the unit vector (cos, sin)
+        rad = math.radians(angle)
+        dx = math.cos(rad)
+        dy = math.sin(rad)
         if to_left is True:
-            direction.x = -abs(direction.x)
+            dx = -abs(dx)
         elif to_left is False:
-            direction.x = abs(direction.x)
-        # Normalize and scale to current speed
-        self.velocity = direction.normalize() * self.speed
-        self.serve_cooldown = COUNTDOWN_TIME
-
-    def update(self, dt_ms: float, bounds: Bounds, paddles: tuple[Paddle, Paddle]) -> int | None:
+            dx = abs(dx)
+        # Scale to current speed
+        self.vx = dx * self.speed
+        self.vy = dy * self.speed
+        self.serve_cooldown = float(COUNTDOWN_TIME)
+
+    def update(self, dt_ms: float, dt: float, bounds: Bounds, paddles: tuple[Paddle, Paddle]) -> int | None:
+        # dt_ms drives the serve cooldown; dt is the pre-scaled frame-tick delta
         # Returns: None for no score, 0 if left scores, 1 if right scores
         if self.serve_cooldown > 0:
-            self.serve_cooldown -= int(dt_ms)
+            self.serve_cooldown -= dt_ms
+            if self.serve_cooldown < 1e-6:
+                # Absorb rounding left over from repeated STEP_MS subtraction
+                self.serve_cooldown = 0.0
             return None
 
-        dt = dt_ms / (1000.0 / FPS)  # normalize to frame-tick movement units
-        move = self.velocity * dt
-        self.rect.x += int(move.x)
-        self.rect.y += int(move.y)
-
-        # Top/bottom collision
-        if self.rect.top <= 0:
-            self.rect.top = 0
-            self.velocity.y *= -1
-        elif self.rect.bottom >= bounds.height:
-            self.rect.bottom = bounds.height
-            self.velocity.y *= -1
-
-        # Paddle collisions
-        left, right = paddles
-        scored: int | None = None
-        if self.rect.right < 0:
-            scored = 1  # right scores
-        elif self.rect.left > bounds.width:
-            scored = 0  # left scores
+        rect = self.rect
+        x, y, self.vx, self.vy, scored = _ball_step(
+            self._x_f, self._y_f, self.vx, self.vy, dt, rect.width, bounds.width, bounds.height
+        )
+        self._x_f = x
+        self._y_f = y
+        rect.x = int(x)
+        rect.y = int(y)
 
-        if scored is not None:
+        if scored >= 0:
             # Speed up slightly on each score to keep tension
             self.speed = min(BALL_SPEED_MAX, self.speed + BALL_SPEED_INCREMENT)
             return scored
 
-        # Check collisions only if ball is on screen
-        if self.rect.colliderect(left.rect) and self.velocity.x < 0:
-            self._bounce_off_paddle(left)
-        elif self.rect.colliderect(right.rect) and self.velocity.x > 0:
-            self._bounce_off_paddle(right)
+        # Paddle collisions
+        left, right = paddles
+        # Check collisions only if ball is on screen; inline AABB overlap tests
+        # against the paddle the ball is heading towards
+        bx_left = rect.x
+        bx_right = bx_left + rect.width
+        by_top = rect.y
+        by_bottom = by_top + rect.height
+        if self.vx < 0:
+            p = left.rect
+            if bx_left < p.right and bx_right > p.left and by_top < p.bottom and by_bottom > p.top:
+                self._bounce_off_paddle(left)
+        elif self.vx > 0:
+            p = right.rect
+            if bx_left < p.right and bx_right > p.left and by_top < p.bottom and by_bottom > p.top:
+                self._bounce_off_paddle(right)
 
         return None
 
     def _bounce_off_paddle(self, paddle: Paddle) -> None:
         # Position correction: place ball outside the paddle to prevent sticking
-        if self.velocity.x < 0:
+        if self.vx < 0:
             self.rect.left = paddle.rect.right
         else:
             self.rect.right = paddle.rect.left
+        self._x_f = float(self.rect.x)
 
         # Compute bounce angle based on hit position (relative to paddle center)
         offset = (self.rect.centery - paddle.rect.centery)
@@ -187,16 +287,29 @@ class Ball:
         norm = max(-1.0, min(1.0, norm))
 
         # Map to angle range (-60 to 60 degrees) to keep play flowing
-        angle = norm * 60
-        direction = 1 if self.velocity.x > 0 else -1
-        new_dir = pygame.Vector2(direction, 0).rotate(angle)
+        rad = norm * _BOUNCE_MAX_RAD
+        # Send the ball back the way it came
+        direction = -1 if self.vx > 0 else 1
+        # Reflect x only; (cos, sin) is already a unit vector so no normalize
+        nx = direction * math.cos(rad)
+        ny = math.sin(rad)
 
         # Slight speed-up on paddle hit
         self.speed = min(BALL_SPEED_MAX, self.speed + BALL_SPEED_INCREMENT)
-        self.velocity = new_dir.normalize() * self.speed
+        self.vx = nx * self.speed
+        self.vy = ny * self.speed
 
-    def draw(self, surf: pygame.Surface) -> None:
-        pygame.draw.rect(surf, WHITE, self.rect, border_radius=self.rect.width // 2)
+    def save_position(self) -> None:
+        self._prev_x_f = self._x_f
+        self._prev_y_f = self._y_f
+
+    def draw(self, surf: pygame.Surface, alpha: float = 1.0) -> pygame.Rect:
+        # Draw between the last two physics positions; returns the drawn rect
+        x = self._prev_x_f + (self._x_f - self._prev_x_f) * alpha
+        y = self._prev_y_f + (self._y_f - self._prev_y_f) * alpha
+        dest = self.rect.move(int(x) - self.rect.x, int(y) - self.rect.y)
+        surf.blit(self.image, dest)
+        return dest
 
 
 class Game:
@@ -204,12 +317,36 @@ class Game:
         pygame.init()
         pygame.display.set_caption("Pong - Pygame")
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        # Let SDL drop everything except the events handled in run()
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([_QUIT, _KEYDOWN, *_REDRAW_EVENTS])
         self.clock = pygame.time.Clock()
         self.bounds = Bounds(WIDTH, HEIGHT)
 
-        # Fonts
-        self.font_score = pygame.font.SysFont("consolas", 48)
-        self.font_small = pygame.font.SysFont("consolas", 20)
+        # Fonts: pygame's bundled default font avoids a system font lookup.
+        # Loading it by path renders at the requested size; Font(None, n) is
+        # scaled down to roughly 0.69 * n
+        font_path = os.path.join(os.path.dirname(pygame.__file__), pygame.font.get_default_font())
+        self.font_score = pygame.font.Font(font_path, 48)
+        self.font_small = pygame.font.Font(font_path, 20)
+
+        # Pre-rendered HUD glyphs: scores only change on point events and the
+        # serve countdown only ever shows 1..4
+        self._score_surfs = [self.font_score.render(str(i), True, WHITE) for i in range(SCORE_TO_WIN + 1)]
+        self._serve_surfs = [self.font_small.render(f"Serve in {s}", True, GREY) for s in range(1, 5)]
+        self._winner_surfs = [
+            self.font_score.render(f"Player {side} Wins!", True, WHITE) for side in ("Left", "Right")
+        ]
+        self._restart_surf = self.font_small.render("Press R to restart or ESC to quit", True, GREY)
+
+        # Entity shapes never change: rasterize once in the display format
+        # (which needs the window) and blit each frame
+        paddle_surf = pygame.Surface((PADDLE_WIDTH, PADDLE_HEIGHT), pygame.SRCALPHA)
+        _draw_rect(paddle_surf, WHITE, paddle_surf.get_rect(), border_radius=4)
+        paddle_surf = paddle_surf.convert_alpha()
+        ball_surf = pygame.Surface((BALL_SIZE, BALL_SIZE), pygame.SRCALPHA)
+        pygame.draw.circle(ball_surf, WHITE, ball_surf.get_rect().center, BALL_SIZE // 2)
+        ball_surf = ball_surf.convert_alpha()
 
         # Entities
         self.left_paddle = Paddle(
@@ -218,6 +355,7 @@ class Game:
             PADDLE_WIDTH,
             PADDLE_HEIGHT,
             PADDLE_SPEED,
+            paddle_surf,
         )
         self.right_paddle = AIPaddle(
             WIDTH - PADDLE_MARGIN - PADDLE_WIDTH,
@@ -225,32 +363,52 @@ class Game:
             PADDLE_WIDTH,
             PADDLE_HEIGHT,
             PADDLE_SPEED * 0.95,
+            HEIGHT,
+            paddle_surf,
         )
-        self.ball = Ball(WIDTH // 2, HEIGHT // 2, BALL_SIZE, BALL_SPEED_START)
+        self.ball = Ball(WIDTH // 2, HEIGHT // 2, BALL_SIZE, BALL_SPEED_START, ball_surf)
         self.ball.reset(self.bounds.center)
 
+        # Static center line, rendered once and blitted each frame
+        self._center_line_surf = self._build_center_line()
+
         # Scores
         self.score = [0, 0]
         self.winner: int | None = None
 
+        # Unsimulated time carried between frames
+        self._accum_ms = 0.0
+
+        # Screen regions drawn last frame; None forces a full redraw
+        self._dirty: list[pygame.Rect] | None = None
+
+    def _build_center_line(self) -> pygame.Surface:
+        seg_h = 20
+        gap = 16
+        surf = pygame.Surface((4, HEIGHT), pygame.SRCALPHA)
+        for y in range(0, HEIGHT, seg_h + gap):
+            _draw_rect(surf, GREY, pygame.Rect(0, y, 4, seg_h), border_radius=2)
+        # Match the display's pixel format so the per-frame blit is a plain copy
+        return surf.convert_alpha()
+
     def handle_input(self) -> None:
         keys = pygame.key.get_pressed()
-        vel = 0.0
-        if keys[pygame.K_w]:
-            vel -= self.left_paddle.speed
-        if keys[pygame.K_s]:
-            vel += self.left_paddle.speed
-        self.left_paddle.velocity = vel
-
-    def update(self, dt_ms: float) -> None:
+        # Key states are 0/1, so the difference is -1, 0 or +1: no branching
+        self.left_paddle.velocity = (keys[_K_S] - keys[_K_W]) * self.left_paddle.speed
+
+    def update(self) -> None:
+        # Advance the simulation by one fixed step of STEP_MS
+        self.left_paddle.save_position()
+        self.right_paddle.save_position()
+        self.ball.save_position()
         if self.winner is not None:
             return
 
         self.handle_input()
-        self.left_paddle.update(self._dt_px(dt_ms), self.bounds)
-        self.right_paddle.update_ai(self._dt_px(dt_ms), self.ball.rect, self.ball.velocity, self.bounds)
+        self.left_paddle.update(_STEP_PX, self.bounds)
+        self.right_paddle.update_ai(_STEP_PX, self.ball.rect, self.ball.vx, self.ball.vy, self.bounds)
 
-        scored = self.ball.update(dt_ms, self.bounds, (self.left_paddle, self.right_paddle))
+        scored = self.ball.update(STEP_MS, _STEP_PX, self.bounds, (self.left_paddle, self.right_paddle))
         if scored is not None:
             self.score[scored] += 1
             if self.score[scored] >= SCORE_TO_WIN:
@@ -259,62 +417,83 @@ class Game:
             self.ball.reset(self.bounds.center, to_left=(scored == 1))
 
     def draw_center_line(self) -> None:
-        seg_h = 20
-        gap = 16
-        x = WIDTH // 2 - 2
-        for y in range(0, HEIGHT, seg_h + gap):
-            pygame.draw.rect(self.screen, GREY, pygame.Rect(x, y, 4, seg_h), border_radius=2)
+        self.screen.blit(self._center_line_surf, (WIDTH // 2 - 2, 0))
 
-    def draw_hud(self) -> None:
-        left = self.font_score.render(str(self.score[0]), True, WHITE)
-        right = self.font_score.render(str(self.score[1]), True, WHITE)
-        self.screen.blit(left, (WIDTH * 0.25 - left.get_width() // 2, 20))
-        self.screen.blit(right, (WIDTH * 0.75 - right.get_width() // 2, 20))
+    def draw_hud(self) -> list[pygame.Rect]:
+        left = self._score_surfs[self.score[0]]
+        right = self._score_surfs[self.score[1]]
+        # Collect all HUD surfaces and submit them in a single blits() call
+        blit_list = [
+            (left, (WIDTH * 0.25 - left.get_width() // 2, 20)),
+            (right, (WIDTH * 0.75 - right.get_width() // 2, 20)),
+        ]
 
         if self.ball.serve_cooldown > 0 and self.winner is None:
-            secs = max(0, int(self.ball.serve_cooldown / 400) + 1)
-            text = self.font_small.render(f"Serve in {secs}", True, GREY)
-            self.screen.blit(text, (WIDTH // 2 - text.get_width() // 2, HEIGHT // 2 - 60))
+            secs = min(len(self._serve_surfs), int(self.ball.serve_cooldown / 400) + 1)
+            text = self._serve_surfs[secs - 1]
+            blit_list.append((text, (WIDTH // 2 - text.get_width() // 2, HEIGHT // 2 - 60)))
 
         if self.winner is not None:
-            msg = f"Player {'Left' if self.winner == 0 else 'Right'} Wins!"
-            text = self.font_score.render(msg, True, WHITE)
-            sub = self.font_small.render("Press R to restart or ESC to quit", True, GREY)
-            self.screen.blit(text, (WIDTH // 2 - text.get_width() // 2, HEIGHT // 2 - 40))
-            self.screen.blit(sub, (WIDTH // 2 - sub.get_width() // 2, HEIGHT // 2 + 20))
+            text = self._winner_surfs[self.winner]
+            sub = self._restart_surf
+            blit_list.append((text, (WIDTH // 2 - text.get_width() // 2, HEIGHT // 2 - 40)))
+            blit_list.append((sub, (WIDTH // 2 - sub.get_width() // 2, HEIGHT // 2 + 20)))
 
-    def _dt_px(self, dt_ms: float) -> float:
-        # Convert milliseconds delta to pixel movement per frame baseline
-        return (dt_ms / (1000.0 / FPS)) * 1.0
+        return self.screen.blits(blit_list)
 
     def run(self) -> None:
         while True:
-            dt_ms = self.clock.tick(FPS)
+            # Physics runs in fixed steps regardless of render timing; leftover
+            # time carries over to the next frame
+            self._accum_ms += min(self.clock.tick(FPS), MAX_FRAME_MS)
             for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+                if event.type == _QUIT:
                     pygame.quit()
                     sys.exit(0)
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
+                if event.type == _KEYDOWN:
+                    if event.key == _K_ESCAPE:
                         pygame.quit()
                         sys.exit(0)
-                    if event.key == pygame.K_r and self.winner is not None:
+                    if event.key == _K_R and self.winner is not None:
                         self.score = [0, 0]
                         self.winner = None
                         self.ball.speed = BALL_SPEED_START
                         self.ball.reset(self.bounds.center)
-
-            self.update(dt_ms)
-
-            # Render
+                if event.type in _REDRAW_EVENTS:
+                    # Window was uncovered or restored; force a full flip
+                    self._dirty = None
+
+            while self._accum_ms >= STEP_MS:
+                self._accum_ms -= STEP_MS
+                self.update()
+            self.render()
+
+    def render(self) -> None:
+        # Only the regions touched last frame are cleared and pushed to the
+        # display, together with the regions drawn this frame
+        prev = self._dirty
+        if prev is None:
             self.screen.fill(BLACK)
-            self.draw_center_line()
-            self.left_paddle.draw(self.screen)
-            self.right_paddle.draw(self.screen)
-            self.ball.draw(self.screen)
-            self.draw_hud()
-
+        else:
+            for rect in prev:
+                self.screen.fill(BLACK, rect)
+
+        # Blend the last two physics states by the unsimulated remainder so
+        # motion stays smooth when a frame runs zero or two steps
+        alpha = self._accum_ms / STEP_MS
+        self.draw_center_line()
+        dirty = [
+            self.left_paddle.draw(self.screen, alpha),
+            self.right_paddle.draw(self.screen, alpha),
+            self.ball.draw(self.screen, alpha),
+        ]
+        dirty.extend(self.draw_hud())
+        self._dirty = dirty
+
+        if prev is None:
             pygame.display.flip()
+        else:
+            pygame.display.update(prev + dirty)
 
 
 if __name__ == "__main__":